@@ -0,0 +1,22 @@
+"""
+Optional build step which compiles the Cython A* core.
+
+The extension is a pure speed-up: when Cython (or a C compiler) is not
+available, the build silently produces a pure-Python wheel and
+`networkx_astar_path` falls back to its Python implementation.
+"""
+from typing import Any, Dict
+
+
+def build(setup_kwargs: Dict[str, Any]) -> None:
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        pass
+    else:
+        setup_kwargs.update(
+            ext_modules=cythonize(
+                ["networkx_astar_path/_astar_core.pyx"],
+                language_level=3,
+            ),
+        )
@@ -0,0 +1,162 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional Cython implementation of the A* main loop.
+
+This mirrors the pure-Python loop in :mod:`networkx_astar_path.astar`
+but with typed locals, so the interpreter overhead of the heap
+operations, dict lookups and tuple packing is paid in C instead. When
+the extension has not been built, :mod:`networkx_astar_path.astar`
+transparently falls back to the pure-Python loop.
+
+The priority queue is kept in structure-of-arrays form: a contiguous C
+array of double priorities next to a list of (node, cost, parent)
+payloads. Sifting then compares raw doubles in one cache-friendly
+buffer instead of Python tuples, and ties never reach the node objects
+at all. (In the pure-Python loop the same rewrite measures ~4x slower
+than the C heapq, which is why it is only done here.)
+"""
+from cpython.mem cimport PyMem_Free, PyMem_Malloc, PyMem_Realloc
+
+
+cdef inline void _sift_up(double* fs, list payloads, Py_ssize_t pos):
+    """Restore the heap invariant after appending an entry at `pos`."""
+    cdef double f = fs[pos]
+    cdef object payload = payloads[pos]
+    cdef Py_ssize_t parent
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        if fs[parent] <= f:
+            break
+        fs[pos] = fs[parent]
+        payloads[pos] = payloads[parent]
+        pos = parent
+    fs[pos] = f
+    payloads[pos] = payload
+
+
+cdef inline void _sift_down(double* fs, list payloads, Py_ssize_t size):
+    """Restore the heap invariant after replacing the root entry."""
+    cdef double f = fs[0]
+    cdef object payload = payloads[0]
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t child = 1
+    while child < size:
+        if child + 1 < size and fs[child + 1] < fs[child]:
+            child += 1
+        if f <= fs[child]:
+            break
+        fs[pos] = fs[child]
+        payloads[pos] = payloads[child]
+        pos = child
+        child = 2 * pos + 1
+    fs[pos] = f
+    payloads[pos] = payload
+
+
+cpdef astar_core(
+    graph,
+    dict adj,
+    source,
+    target,
+    heuristic,
+    weight_fn,
+    weight_name,
+    bint weight_two_arg,
+    bint consistent_heuristic,
+):
+    """Run the A* main loop and return ``(path, cost)``, or ``None`` if
+    unreachable.
+
+    ``weight_fn`` is the three-argument weight callable or ``None``; when it
+    is ``None``, ``weight_name`` is the edge attribute to read (missing
+    attributes default to ``1``).
+    """
+    cdef dict enqueued = {}
+    cdef dict explored = {}
+    cdef list path
+    cdef double dist, ncost, h, qcost, last_f
+    cdef Py_ssize_t size = 1
+    cdef Py_ssize_t capacity = 64
+
+    cdef list payloads = [(source, 0.0, None)]
+    cdef double* fs = <double*> PyMem_Malloc(capacity * sizeof(double))
+    cdef double* new_fs
+    if fs == NULL:
+        raise MemoryError()
+    fs[0] = 0.0
+
+    try:
+        while size > 0:
+            curnode, dist, parent = <tuple> payloads[0]
+
+            # Pop: move the last entry to the root and sift it down.
+            size -= 1
+            last_f = fs[size]
+            last_payload = payloads.pop()
+            if size > 0:
+                fs[0] = last_f
+                payloads[0] = last_payload
+                _sift_down(fs, payloads, size)
+
+            if curnode == target:
+                path = [curnode]
+                node = parent
+                while node is not None:
+                    path.append(node)
+                    node = explored[node]
+                path.reverse()
+                return path, dist
+
+            # Lazy deletion: a popped entry is stale exactly when its cost no
+            # longer matches the best known cost for the node.
+            entry = enqueued.get(curnode)
+            if entry is not None and <double>(<tuple>entry)[0] != dist:
+                continue
+
+            # Do not override the parent of the starting node when a cycle
+            # leads back to it; its empty parent terminates the path
+            # reconstruction.
+            if explored.get(curnode, False) is None:
+                continue
+
+            explored[curnode] = parent
+
+            if weight_fn is not None and not weight_two_arg:
+                prev_edge = (parent, curnode) if parent is not None else None
+
+            for neighbor, w in (<dict>adj[curnode]).items():
+                # None only maps to the starting node, whose parent must stay.
+                if consistent_heuristic and explored.get(neighbor) is not None:
+                    continue
+                if weight_fn is None:
+                    ncost = dist + (<dict>w).get(weight_name, 1)
+                elif weight_two_arg:
+                    ncost = dist + weight_fn(graph, (curnode, neighbor))
+                else:
+                    ncost = dist + weight_fn(graph, prev_edge, (curnode, neighbor))
+
+                entry = enqueued.get(neighbor)
+                if entry is not None:
+                    qcost, h = <tuple> entry
+                    if qcost <= ncost:
+                        continue
+                else:
+                    h = heuristic(neighbor, target)
+                enqueued[neighbor] = ncost, h
+
+                # Push: append and sift up, growing the priority buffer as
+                # needed.
+                if size == capacity:
+                    capacity *= 2
+                    new_fs = <double*> PyMem_Realloc(fs, capacity * sizeof(double))
+                    if new_fs == NULL:
+                        raise MemoryError()
+                    fs = new_fs
+                fs[size] = ncost + h
+                payloads.append((neighbor, ncost, curnode))
+                _sift_up(fs, payloads, size)
+                size += 1
+
+        return None
+    finally:
+        PyMem_Free(fs)
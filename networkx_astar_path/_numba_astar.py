@@ -0,0 +1,224 @@
+"""
+Numba-jitted A* specialisation for graphs in CSR form.
+
+The generic :func:`networkx_astar_path.astar_path` cannot be jitted
+because it deals with arbitrary node objects and weight callables. For
+graphs whose nodes are the contiguous integers ``0..n-1`` and whose
+weight is a plain edge attribute, the search can instead run over a CSR
+(compressed sparse row) representation with no interpreter involvement
+at all.
+
+Importing this module requires ``numpy`` and ``numba``; both are
+optional dependencies and :mod:`networkx_astar_path.astar` degrades
+gracefully when the import fails.
+"""
+from typing import Tuple
+
+import networkx as nx
+import numpy as np
+from numba import njit
+
+__all__ = ["astar_path_csr", "csr_representation"]
+
+
+@njit(cache=True)
+def _heap_push(
+    heap_f: np.ndarray, heap_node: np.ndarray, size: int, f: float, node: int
+) -> int:
+    """Push ``(f, node)`` onto the binary heap held in two parallel arrays."""
+    pos = size
+    heap_f[pos] = f
+    heap_node[pos] = node
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        if heap_f[parent] <= heap_f[pos]:
+            break
+        heap_f[parent], heap_f[pos] = heap_f[pos], heap_f[parent]
+        heap_node[parent], heap_node[pos] = heap_node[pos], heap_node[parent]
+        pos = parent
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(heap_f: np.ndarray, heap_node: np.ndarray, size: int) -> int:
+    """Pop the smallest entry; returns its node, the new size is ``size - 1``.
+
+    The popped priority is left in ``heap_f[size - 1]`` but is not needed by
+    the caller, so only the node is returned.
+    """
+    node = heap_node[0]
+    size -= 1
+    heap_f[0] = heap_f[size]
+    heap_node[0] = heap_node[size]
+    pos = 0
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap_f[child + 1] < heap_f[child]:
+            child += 1
+        if heap_f[pos] <= heap_f[child]:
+            break
+        heap_f[pos], heap_f[child] = heap_f[child], heap_f[pos]
+        heap_node[pos], heap_node[child] = heap_node[child], heap_node[pos]
+        pos = child
+    return node
+
+
+def _astar_csr_core_impl(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    source: int,
+    target: int,
+    heuristic: np.ndarray,
+) -> Tuple[np.ndarray, float]:
+    n = indptr.shape[0] - 1
+    g = np.full(n, np.inf)
+    parent = np.full(n, -1, dtype=np.int64)
+    closed = np.zeros(n, dtype=np.bool_)
+
+    # Every successful relaxation pushes at most once, so the number of
+    # live heap entries is bounded by the number of edges (plus the source).
+    capacity = indices.shape[0] + 1
+    heap_f = np.empty(capacity)
+    heap_node = np.empty(capacity, dtype=np.int64)
+    size = 0
+
+    g[source] = 0.0
+    size = _heap_push(heap_f, heap_node, size, heuristic[source], source)
+
+    while size > 0:
+        curnode = _heap_pop(heap_f, heap_node, size)
+        size -= 1
+
+        if curnode == target:
+            # Walk the parent chain to get the path length, then fill it.
+            length = 1
+            node = curnode
+            while parent[node] != -1:
+                node = parent[node]
+                length += 1
+            path = np.empty(length, dtype=np.int64)
+            node = curnode
+            for i in range(length - 1, -1, -1):
+                path[i] = node
+                node = parent[node]
+            return path, g[curnode]
+
+        if closed[curnode]:
+            continue
+        closed[curnode] = True
+
+        dist = g[curnode]
+        for k in range(indptr[curnode], indptr[curnode + 1]):
+            neighbor = indices[k]
+            if closed[neighbor]:
+                continue
+            ncost = dist + weights[k]
+            if ncost < g[neighbor]:
+                g[neighbor] = ncost
+                parent[neighbor] = curnode
+                size = _heap_push(
+                    heap_f, heap_node, size, ncost + heuristic[neighbor], neighbor
+                )
+
+    return np.empty(0, dtype=np.int64), np.inf
+
+
+# cache=True amortises the JIT warmup across processes via numba's
+# on-disk cache; only the very first call on a machine pays for it.
+_astar_csr_core = njit(cache=True)(_astar_csr_core_impl)
+
+
+def csr_representation(graph: nx.Graph, weight_name: str):
+    """Return ``(indptr, indices, weights)`` for `graph`, or ``None``.
+
+    ``None`` is returned when the graph does not qualify for the CSR fast
+    path: its nodes are not the contiguous integers ``0..n-1``, or scipy
+    (needed for the conversion) is not installed.
+
+    The representation is cached in ``graph.__networkx_cache__`` when
+    available, so repeated searches on the same graph only pay for the
+    conversion once. NetworkX clears that cache on graph API mutations
+    (``add_edge``, ``set_edge_attributes``, ...) but NOT on in-place
+    edge-data writes such as ``G[u][v]['weight'] = x`` — after those the
+    cached conversion is stale and must be dropped explicitly via
+    ``G.__networkx_cache__.clear()``.
+    """
+    cache = getattr(graph, "__networkx_cache__", None)
+    if cache is not None:
+        csr_cache = cache.setdefault("networkx_astar_path_csr", {})
+        if weight_name in csr_cache:
+            return csr_cache[weight_name]
+
+    n = graph.number_of_nodes()
+    if not all(type(node) is int and 0 <= node < n for node in graph._node):
+        csr = None
+    else:
+        try:
+            matrix = nx.to_scipy_sparse_array(
+                graph, nodelist=range(n), weight=weight_name, format="csr"
+            )
+        except ImportError:  # pragma: no cover - scipy not installed
+            csr = None
+        else:
+            csr = (
+                np.asarray(matrix.indptr, dtype=np.int64),
+                np.asarray(matrix.indices, dtype=np.int64),
+                np.asarray(matrix.data, dtype=np.float64),
+            )
+
+    if cache is not None:
+        csr_cache[weight_name] = csr
+    return csr
+
+
+def _astar_csr(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    source_idx: int,
+    target_idx: int,
+    heuristic_arr: np.ndarray,
+) -> Tuple[np.ndarray, float]:
+    """Like :func:`astar_path_csr`, but also returns the path cost."""
+    path, cost = _astar_csr_core(
+        np.asarray(indptr, dtype=np.int64),
+        np.asarray(indices, dtype=np.int64),
+        np.asarray(weights, dtype=np.float64),
+        source_idx,
+        target_idx,
+        np.asarray(heuristic_arr, dtype=np.float64),
+    )
+    if path.shape[0] == 0:
+        raise nx.NetworkXNoPath(
+            f"Node {target_idx} not reachable from {source_idx}"
+        )
+    return path, cost
+
+
+def astar_path_csr(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    source_idx: int,
+    target_idx: int,
+    heuristic_arr: np.ndarray,
+) -> np.ndarray:
+    """Shortest path on a CSR graph, as an array of node indices.
+
+    ``indptr``, ``indices`` and ``weights`` describe the graph in CSR form
+    (as produced by :func:`networkx.to_scipy_sparse_array`);
+    ``heuristic_arr[i]`` is the heuristic estimate from node ``i`` to the
+    target. The heuristic must be consistent and the weights non-negative.
+
+    Raises
+    ------
+    NetworkXNoPath
+        If no path exists between source and target.
+    """
+    path, _ = _astar_csr(
+        indptr, indices, weights, source_idx, target_idx, heuristic_arr
+    )
+    return path
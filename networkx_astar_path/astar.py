@@ -1,13 +1,55 @@
 """
 Shortest paths and path lengths using the A* ("A star") algorithm.
 """
+import inspect
+from functools import lru_cache
 from heapq import heappop, heappush
-from itertools import chain, count
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import networkx as nx
 
-__all__ = ["astar_path", "astar_path_length"]
+try:
+    # Compiled A* main loop; built from _astar_core.pyx when Cython is
+    # available. The pure-Python loop below is the fallback.
+    from ._astar_core import astar_core as _astar_core
+except ImportError:  # pragma: no cover
+    _astar_core = None
+
+try:
+    # numpy on its own enables the vectorised heuristics; it is also the
+    # base of the jitted CSR stack below.
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    # Jitted CSR specialisation; requires the optional numpy/numba/scipy
+    # stack and graphs whose nodes are contiguous integers.
+    from ._numba_astar import _astar_csr, astar_path_csr, csr_representation
+except ImportError:  # pragma: no cover
+    _astar_csr = None
+    astar_path_csr = None
+    csr_representation = None
+
+__all__ = [
+    "astar_path",
+    "astar_path_bidirectional",
+    "astar_path_length",
+    "cached_heuristic",
+]
+if astar_path_csr is not None:
+    __all__.append("astar_path_csr")
 
 
 Node = Any
@@ -16,54 +58,391 @@ WeightFunction = Callable[[nx.Graph, Optional[Edge], Edge], float]
 HeuristicFunction = Callable[[Node, Node], float]
 
 
-def _weight_function(
-    graph: nx.Graph, weight: Union[str, WeightFunction]
-) -> WeightFunction:
-    """Returns a function that returns the weight of an edge.
-    The returned function is specifically suitable for input to
-    functions :func:`_dijkstra` and :func:`_bellman_ford_relaxation`.
-    Parameters
-    ----------
-    graph : NetworkX graph.
-    weight : string or function
-        If it is callable, `weight` itself is returned. If it is a string,
-        it is assumed to be the name of the edge attribute that represents
-        the weight of an edge. In that case, a function is returned that
-        gets the edge weight according to the specified edge attribute.
-    Returns
-    -------
-    function
-        This function returns a callable that accepts exactly three inputs:
-        a node, an node adjacent to the first one, and the edge attribute
-        dictionary for the eedge joining those nodes. That function returns
-        a number representing the weight of an edge.
-    If `graph` is a multigraph, and `weight` is not callable, the
-    minimum edge weight over all parallel edges is returned. If any edge
-    does not have an attribute with key `weight`, it is assumed to
-    have weight one.
+def _default_heuristic(u: Node, v: Node) -> float:
+    return 0
+
+
+_EARTH_RADIUS_M = 6_371_000.0
+
+
+def _heuristic_array(kind: str, coords: "np.ndarray", target_idx: int) -> "np.ndarray":
+    """Distances from every coordinate row to the target row, vectorised.
+
+    One numpy expression per metric replaces a scalar Python heuristic call
+    per enqueued node.
     """
-    if callable(weight):
-        return weight
+    if kind == "euclidean":
+        delta = coords - coords[target_idx]
+        return np.sqrt((delta * delta).sum(axis=1))
+    if kind == "manhattan":
+        delta = coords - coords[target_idx]
+        return np.abs(delta).sum(axis=1)
+    if kind == "haversine":
+        # Rows are (latitude, longitude) in degrees; result is the
+        # great-circle distance in metres.
+        lat = np.radians(coords[:, 0])
+        lon = np.radians(coords[:, 1])
+        sin_dlat = np.sin((lat - lat[target_idx]) / 2)
+        sin_dlon = np.sin((lon - lon[target_idx]) / 2)
+        a = sin_dlat ** 2 + np.cos(lat) * np.cos(lat[target_idx]) * sin_dlon ** 2
+        return 2 * _EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+    raise ValueError(
+        f"Unknown heuristic {kind!r}; expected 'euclidean', 'manhattan' or 'haversine'"
+    )
+
+
+def _precomputed_heuristic(
+    graph: nx.Graph, kind: str, node_coords: Any, target: Node
+) -> HeuristicFunction:
+    """Turn a named metric plus a coordinate array into a heuristic function.
+
+    The coordinate rows follow the iteration order of ``graph.nodes``. All
+    distances to the target are computed in one vectorised pass; the
+    returned function is a plain array lookup.
+    """
+    if np is None:
+        raise ImportError("numpy is required for named heuristics")
+    if node_coords is None:
+        raise ValueError(f"Heuristic {kind!r} requires node_coords")
+
+    coords = np.asarray(node_coords, dtype=np.float64)
+    index = {node: i for i, node in enumerate(graph.nodes)}
+    h_arr = _heuristic_array(kind, coords, index[target])
+    return lambda u, v: h_arr[index[u]]
+
+
+def _weight_arity(weight_fn: WeightFunction) -> int:
+    """Number of positional arguments `weight_fn` accepts, 2 or 3.
+
+    Weight functions that do not care about the previous edge can accept
+    just ``(graph, cur_edge)``; detecting that up front lets the search
+    skip building a ``prev_edge`` tuple per expansion. Anything whose
+    signature cannot be inspected is assumed to take the full three
+    arguments.
+    """
+    try:
+        parameters = inspect.signature(weight_fn).parameters.values()
+    except (TypeError, ValueError):
+        return 3
+
+    positional = 0
+    for parameter in parameters:
+        if parameter.kind in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            positional += 1
+        elif parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+            return 3
+    return 2 if positional == 2 else 3
+
+
+def cached_heuristic(
+    heuristic: HeuristicFunction, maxsize: Optional[int] = None
+) -> HeuristicFunction:
+    """Wraps a pure heuristic function in a :func:`functools.lru_cache`.
+
+    Useful when the same expensive heuristic (landmark distances,
+    great-circle computations, ...) is evaluated for the same nodes across
+    many :func:`astar_path` calls. The heuristic must be a pure function of
+    its two node arguments.
+    """
+    return lru_cache(maxsize=maxsize)(heuristic)
+
+
+def _astar_int_nodes(  # noqa: C901
+    graph: nx.Graph,
+    adj: Dict[int, Dict[int, Dict[str, Any]]],
+    source: int,
+    target: int,
+    heuristic: HeuristicFunction,
+    weight_fn: Optional[WeightFunction],
+    weight_name: Optional[str],
+    weight_two_arg: bool,
+    consistent_heuristic: bool,
+) -> Tuple[List[int], float]:
+    """A* main loop for graphs whose nodes are the integers ``0..n-1``.
+
+    The per-node bookkeeping lives in flat lists indexed by node instead of
+    dicts: no hashing, no per-entry dict records and no (cost, h) tuple
+    allocations. Plain lists rather than numpy arrays on purpose — scalar
+    numpy indexing boxes a fresh float object per access, which costs more
+    than it saves in an interpreted loop (the jitted CSR core is where the
+    numpy layout pays off). Since int nodes are totally ordered, heap
+    entries also need no tie-breaker slot.
+    """
+    push = heappush
+    pop = heappop
+    inf = float("inf")
+
+    n = len(adj)
+    # inf marks nodes that were never enqueued.
+    enq_cost = [inf] * n
+    enq_h = [0.0] * n
+    # -1 marks unexplored nodes; the source gets the root marker -2.
+    explored_parent = [-1] * n
+
+    queue: List[Tuple[float, int, float, int]] = [(0, source, 0, -2)]
+
+    while queue:
+        _, curnode, dist, parent = pop(queue)
+
+        if curnode == target:
+            path = [curnode]
+            node = parent
+            while node != -2:
+                path.append(node)
+                node = explored_parent[node]
+            path.reverse()
+            return path, dist
+
+        # Lazy deletion, as in the generic loop: a mismatch with the best
+        # known cost marks a superseded entry.
+        qcost = enq_cost[curnode]
+        if qcost != inf and qcost != dist:
+            continue
+
+        # Do not override the parent of the starting node when a cycle leads
+        # back to it; its root marker terminates the path reconstruction.
+        if explored_parent[curnode] == -2:
+            continue
+
+        explored_parent[curnode] = parent
+
+        if weight_fn is not None and not weight_two_arg:
+            prev_edge: Optional[Edge] = (parent, curnode) if parent != -2 else None
+
+        for neighbor, w in adj[curnode].items():
+            # A finalised neighbour cannot be improved upon (the source,
+            # marked -2, must stay overridable-checked like the dict path).
+            if consistent_heuristic and explored_parent[neighbor] >= 0:
+                continue
+            if weight_fn is None:
+                ncost = dist + w.get(weight_name, 1)
+            elif weight_two_arg:
+                ncost = dist + weight_fn(graph, (curnode, neighbor))  # type: ignore
+            else:
+                ncost = dist + weight_fn(graph, prev_edge, (curnode, neighbor))
+
+            qcost = enq_cost[neighbor]
+            if qcost != inf:
+                if qcost <= ncost:
+                    continue
+                h = enq_h[neighbor]
+            else:
+                h = heuristic(neighbor, target)
+                enq_h[neighbor] = h
+            enq_cost[neighbor] = ncost
+            push(queue, (ncost + h, neighbor, ncost, curnode))
+
+    raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+
+
+def _astar(  # noqa: C901
+    graph: nx.Graph,
+    source: Node,
+    target: Node,
+    heuristic: Optional[Union[str, HeuristicFunction]] = None,
+    weight: Union[str, WeightFunction] = "weight",
+    consistent_heuristic: bool = True,
+    heuristic_cache: Optional[MutableMapping[Node, float]] = None,
+    node_coords: Optional[Any] = None,
+) -> Tuple[List[Node], float]:
+    """Run the A* search and return ``(path, cost)``.
+
+    The search already accumulates the path cost in its distance bookkeeping,
+    so both :func:`astar_path` and :func:`astar_path_length` are thin wrappers
+    around this function; the latter in particular must not re-walk the path
+    through the weight function a second time.
+    """
+    if source not in graph or target not in graph:
+        msg = f"Either source {source} or target {target} is not in graph"
+        raise nx.NodeNotFound(msg)
+
+    if isinstance(heuristic, str):
+        heuristic = _precomputed_heuristic(graph, heuristic, node_coords, target)
+
+    if heuristic is None:
+        # The default heuristic is h=0 - same as Dijkstra's algorithm
+        heuristic = _default_heuristic
+    elif heuristic_cache is not None:
+        inner_heuristic = heuristic
+        cache_get = heuristic_cache.get
+
+        def heuristic(u: Node, v: Node) -> float:
+            h = cache_get(u)
+            if h is None:
+                h = inner_heuristic(u, v)
+                heuristic_cache[u] = h
+            return h
+
+    push = heappush
+    pop = heappop
 
-    if graph.is_multigraph():
-        raise NotImplementedError(
-            "Automatic generation of a weight function for a MultiDiGraph is currently not supported."
+    # For string weights the edge-data dict is already in hand while iterating
+    # the adjacency, so the attribute can be read inline instead of going
+    # through the _weight_function closure (and its get_edge_data call) on
+    # every single edge.
+    if callable(weight):
+        weight_fn: Optional[WeightFunction] = weight
+        weight_name = None
+        weight_two_arg = _weight_arity(weight) == 2
+    else:
+        if graph.is_multigraph():
+            raise NotImplementedError(
+                "Automatic generation of a weight function for a MultiDiGraph is currently not supported."
+            )
+        weight_fn = None
+        weight_name = weight
+        weight_two_arg = False
+
+    if csr_representation is not None and weight_fn is None and consistent_heuristic:
+        csr = csr_representation(graph, weight_name)
+        if csr is not None:
+            indptr, indices, weights = csr
+            if heuristic is _default_heuristic:
+                h_arr = np.zeros(len(indptr) - 1)
+            else:
+                h_arr = np.fromiter(
+                    (heuristic(node, target) for node in range(len(indptr) - 1)),
+                    dtype=np.float64,
+                )
+            path, cost = _astar_csr(indptr, indices, weights, source, target, h_arr)
+            return path.tolist(), cost
+
+    # Bind the adjacency dict-of-dicts once; going through graph[curnode]
+    # would pay for Graph.__getitem__ and an AtlasView on every expansion.
+    adj = graph._adj
+
+    if _astar_core is not None and isinstance(adj, dict):
+        result = _astar_core(
+            graph,
+            adj,
+            source,
+            target,
+            heuristic,
+            weight_fn,
+            weight_name,
+            weight_two_arg,
+            consistent_heuristic,
+        )
+        if result is None:
+            raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+        return result
+
+    # Contiguous integer nodes allow backing the per-node bookkeeping with
+    # flat lists instead of dicts (no hashing, no per-entry allocations).
+    n = graph.number_of_nodes()
+    if all(type(node) is int and 0 <= node < n for node in adj):
+        return _astar_int_nodes(
+            graph,
+            adj,
+            source,
+            target,
+            heuristic,
+            weight_fn,
+            weight_name,
+            weight_two_arg,
+            consistent_heuristic,
         )
 
-    weight_name = weight
-    return lambda _G, prev_edge, cur_edge: _G.get_edge_data(*cur_edge)[weight_name]
+    # The queue stores priority, node, cost to reach and the parent.
+    # Uses Python heapq to keep in priority order.
+    # id(node) in the second slot prevents the underlying heap from
+    # attempting to compare the nodes themselves; unlike a count() it is a
+    # C-level lookup with no extra Python call per push.
+    queue: List[Tuple[float, int, Node, float, Node]] = [
+        (0, id(source), source, 0, None)
+    ]
+
+    # Maps enqueued nodes to distance of discovered paths and the
+    # computed heuristics to target. We avoid computing the heuristics
+    # more than once and inserting the node into the queue too many times.
+    enqueued: Dict[Node, Tuple[float, float]] = {}
+    # Maps explored nodes to parent closest to the source.
+    explored: Dict[Node, Node] = {}
+
+    # Bound methods and a sentinel turn the membership-test-plus-lookup
+    # pairs below into a single hash probe per dict access.
+    enqueued_get = enqueued.get
+    explored_get = explored.get
+    _missing: Any = object()
 
+    while queue:
+        # Pop the smallest item from queue.
+        _, __, curnode, dist, parent = pop(queue)
 
-def _default_heuristic(u: Node, v: Node) -> float:
-    return 0
+        if curnode == target:
+            path = [curnode]
+            node = parent
+            while node is not None:
+                path.append(node)
+                node = explored[node]
+            path.reverse()
+            return path, dist
+
+        # Lazy deletion: pushes never remove the entries they supersede, so an
+        # entry is stale exactly when its cost no longer matches the best
+        # known cost for the node. Each push strictly improves on the cost in
+        # enqueued, which makes this a plain equality test.
+        entry = enqueued_get(curnode)
+        if entry is not None and entry[0] != dist:
+            continue
+
+        # Do not override the parent of the starting node when a cycle leads
+        # back to it; its empty parent terminates the path reconstruction.
+        if explored_get(curnode, _missing) is None:
+            continue
+
+        explored[curnode] = parent
+
+        if weight_fn is not None and not weight_two_arg:
+            # The edge we arrived on is fully described by the parent; there
+            # is no need to drag the whole explored path along in every queue
+            # entry.
+            prev_edge: Optional[Edge] = (
+                (parent, curnode) if parent is not None else None
+            )
+
+        for neighbor, w in adj[curnode].items():
+            # A finalised neighbour cannot be improved upon, so evaluating its
+            # weight and pushing it onto the queue again is wasted work.
+            # (None only maps to the starting node, whose parent must stay.)
+            if consistent_heuristic and explored_get(neighbor) is not None:
+                continue
+            if weight_fn is None:
+                ncost = dist + w.get(weight_name, 1)
+            elif weight_two_arg:
+                ncost = dist + weight_fn(graph, (curnode, neighbor))  # type: ignore
+            else:
+                ncost = dist + weight_fn(graph, prev_edge, (curnode, neighbor))
+
+            entry = enqueued_get(neighbor, _missing)
+            if entry is not _missing:
+                qcost, h = entry
+                # if qcost <= ncost, a less costly path from the
+                # neighbor to the source was already determined.
+                # Therefore, we won't attempt to push this neighbor
+                # to the queue
+                if qcost <= ncost:
+                    continue
+            else:
+                h = heuristic(neighbor, target)
+            enqueued[neighbor] = ncost, h
+            push(queue, (ncost + h, id(neighbor), neighbor, ncost, curnode))  # type: ignore
+
+    raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
 
 
-def astar_path(  # noqa: C901
+def astar_path(
     graph: nx.Graph,
     source: Node,
     target: Node,
-    heuristic: Optional[HeuristicFunction] = None,
+    heuristic: Optional[Union[str, HeuristicFunction]] = None,
     weight: Union[str, WeightFunction] = "weight",
+    consistent_heuristic: bool = True,
+    heuristic_cache: Optional[MutableMapping[Node, float]] = None,
+    node_coords: Optional[Any] = None,
 ) -> Sequence[Node]:
     """Returns a list of nodes in a shortest path between source and target
     using the A* ("A-star") algorithm.
@@ -80,10 +459,15 @@ def astar_path(  # noqa: C901
     target : node
        Ending node for path
 
-    heuristic : function
+    heuristic : string or function
        A function to evaluate the estimate of the distance
        from the a node to the target.  The function takes
        two nodes arguments and must return a number.
+       Alternatively one of ``'euclidean'``, ``'manhattan'`` or
+       ``'haversine'``; the distances are then precomputed from
+       `node_coords` in a single vectorised numpy pass instead of one
+       Python call per enqueued node. ``'haversine'`` expects
+       ``(latitude, longitude)`` rows in degrees and yields metres.
 
     weight : string or function
        If this is a string, then edge weights will be accessed via the
@@ -94,13 +478,45 @@ def astar_path(  # noqa: C901
        If this is a function, the weight of an edge is the value
        returned by the function. The function must accept exactly three
        positional arguments: the graph itself and tuples of the previous and
-       the current edge. The function must return a number.
+       the current edge. The function must return a number. A function that
+       does not care about the previous edge may instead accept just the
+       graph and the current edge; no ``prev_edge`` tuples are constructed
+       then.
+
+    consistent_heuristic : bool
+       If True (the default), neighbours whose shortest path has already
+       been finalised are skipped without re-evaluating the weight function
+       or touching the queue. This is only valid if the heuristic is
+       consistent and the weight of an edge does not depend on the path
+       taken to reach it. Pass False for weight functions that use
+       ``prev_edge``, as a node may then have to be re-expanded via a
+       different predecessor.
+
+    heuristic_cache : mutable mapping, optional
+       Caches heuristic values by node, so repeated searches towards the
+       same target do not re-evaluate an expensive heuristic. The caller
+       owns the mapping and must use a separate one per (graph, target)
+       pair. See also :func:`cached_heuristic` for pure heuristics.
+
+    node_coords : array-like, optional
+       Node coordinates for the named heuristics, one row per node in the
+       iteration order of ``graph.nodes``. Requires numpy.
 
     Raises
     ------
     NetworkXNoPath
         If no path exists between source and target.
 
+    Notes
+    -----
+    Graphs whose nodes are the contiguous integers ``0..n-1`` may be
+    searched through a cached CSR conversion when the optional
+    numpy/numba/scipy stack is installed. NetworkX drops that cache on
+    graph API mutations (``add_edge``, ``set_edge_attributes``, ...), but
+    not on in-place edge-data writes such as ``graph[u][v]['weight'] = x``.
+    Call ``graph.__networkx_cache__.clear()`` after such writes, or the
+    search may run on stale weights.
+
     Examples
     --------
     >>> graph = nx.path_graph(5)
@@ -120,101 +536,213 @@ def astar_path(  # noqa: C901
     --------
     shortest_path, dijkstra_path
 
+    """
+    path, _ = _astar(
+        graph,
+        source,
+        target,
+        heuristic,
+        weight,
+        consistent_heuristic,
+        heuristic_cache,
+        node_coords,
+    )
+    return path
+
+
+def _live_top(
+    queue: List[Tuple[float, int, Node, float]],
+    costs: Dict[Node, float],
+    closed: Set[Node],
+) -> float:
+    """Drop stale entries from the front of `queue` and return the priority
+    of the first live one, or infinity if the queue is exhausted."""
+    while queue:
+        priority, _, node, dist = queue[0]
+        if node not in closed and costs.get(node) == dist:
+            return priority
+        heappop(queue)
+    return float("inf")
+
+
+def astar_path_bidirectional(  # noqa: C901
+    graph: nx.Graph,
+    source: Node,
+    target: Node,
+    heuristic: Optional[HeuristicFunction] = None,
+    weight: Union[str, WeightFunction] = "weight",
+) -> Sequence[Node]:
+    """Returns a list of nodes in a shortest path between source and target,
+    searching from both endpoints simultaneously.
+
+    Two frontiers are grown at once, forward from `source` and backward
+    from `target`, using the meet-in-the-middle priority
+    ``max(g + h, 2 * g)`` of Holte et al. On lattice-like graphs this
+    typically expands far fewer nodes than a single forward search.
+
+    The search requires non-negative edge weights and a consistent
+    heuristic. Weight functions are supported, but they are always called
+    with ``prev_edge=None``: a weight that depends on the path taken is
+    incompatible with searching from both ends.
+
+    Parameters
+    ----------
+    graph : NetworkX graph
+
+    source : node
+       Starting node for path
+
+    target : node
+       Ending node for path
+
+    heuristic : function
+       A function to evaluate the estimate of the distance
+       from the a node to the target.  The function takes
+       two nodes arguments and must return a number.
+
+    weight : string or function
+       Same as for :func:`astar_path`, except that ``prev_edge`` is always
+       ``None``.
+
+    Raises
+    ------
+    NetworkXNoPath
+        If no path exists between source and target.
+
+    See Also
+    --------
+    astar_path
+
     """
     if source not in graph or target not in graph:
         msg = f"Either source {source} or target {target} is not in graph"
         raise nx.NodeNotFound(msg)
 
+    if source == target:
+        return [source]
+
     if heuristic is None:
-        # The default heuristic is h=0 - same as Dijkstra's algorithm
         heuristic = _default_heuristic
 
-    push = heappush
-    pop = heappop
-    weight = _weight_function(graph, weight)
-
-    # The queue stores priority, node, cost to reach, the parent and the explored path.
-    # Uses Python heapq to keep in priority order.
-    # Add a counter to the queue to prevent the underlying heap from
-    # attempting to compare the nodes themselves. The hash breaks ties in the
-    # priority and is guaranteed unique for all nodes in the graph.
-    c = count()
-    queue: List[Tuple[int, int, Node, float, Node, List[Node]]] = [
-        (0, next(c), source, 0, None, [source])
-    ]
-
-    # Maps enqueued nodes to distance of discovered paths and the
-    # computed heuristics to target. We avoid computing the heuristics
-    # more than once and inserting the node into the queue too many times.
-    enqueued: Dict[Node, Tuple[float, float]] = {}
-    # Maps explored nodes to parent closest to the source.
-    explored: Dict[Node, Node] = {}
+    if callable(weight):
+        weight_fn = weight
 
-    while queue:
-        # Pop the smallest item from queue.
-        _, __, curnode, dist, parent, explored_path = pop(queue)
+        if _weight_arity(weight) == 2:
 
-        if curnode == target:
-            path = [curnode]
-            node = parent
-            while node is not None:
-                path.append(node)
-                node = explored[node]
-            path.reverse()
-            return path
+            def edge_cost(u: Node, v: Node, data: Dict[str, Any]) -> float:
+                return weight_fn(graph, (u, v))  # type: ignore
 
-        if curnode in explored:
-            # Do not override the parent of starting node
-            if explored[curnode] is None:
-                continue
+        else:
 
-            # Skip bad paths that were enqueued before finding a better one
-            qcost, h = enqueued[curnode]
-            if qcost < dist:
-                continue
+            def edge_cost(u: Node, v: Node, data: Dict[str, Any]) -> float:
+                return weight_fn(graph, None, (u, v))
 
-        explored[curnode] = parent
+    else:
+        if graph.is_multigraph():
+            raise NotImplementedError(
+                "Automatic generation of a weight function for a MultiDiGraph is currently not supported."
+            )
+        weight_name = weight
 
-        for neighbor, w in graph[curnode].items():
-            cur_edge = (curnode, neighbor)
-            try:
-                prev_edge: Optional[Edge] = (explored_path[-2], curnode)
-            except IndexError:
-                prev_edge = None
-            ncost = dist + weight(graph, prev_edge, cur_edge)
+        def edge_cost(u: Node, v: Node, data: Dict[str, Any]) -> float:
+            return data.get(weight_name, 1)
 
-            if neighbor in enqueued:
-                qcost, h = enqueued[neighbor]
-                # if qcost <= ncost, a less costly path from the
-                # neighbor to the source was already determined.
-                # Therefore, we won't attempt to push this neighbor
-                # to the queue
-                if qcost <= ncost:
-                    continue
+    push = heappush
+    pop = heappop
+    inf = float("inf")
+    succ = graph._adj
+    pred = graph._pred if graph.is_directed() else graph._adj
+
+    # Per direction: the queue (priority, id tie-breaker, node, cost to
+    # reach), the best known costs, the parent pointers and the set of
+    # finalised nodes.
+    queue_f: List[Tuple[float, int, Node, float]] = [
+        (heuristic(source, target), id(source), source, 0)
+    ]
+    queue_b: List[Tuple[float, int, Node, float]] = [
+        (heuristic(source, target), id(target), target, 0)
+    ]
+    costs_f: Dict[Node, float] = {source: 0}
+    costs_b: Dict[Node, float] = {target: 0}
+    parent_f: Dict[Node, Node] = {}
+    parent_b: Dict[Node, Node] = {}
+    closed_f: Set[Node] = set()
+    closed_b: Set[Node] = set()
+
+    # Cost of the best path through a meeting point found so far.
+    mu = inf
+    meeting: Optional[Node] = None
+
+    while True:
+        top_f = _live_top(queue_f, costs_f, closed_f)
+        top_b = _live_top(queue_b, costs_b, closed_b)
+        # Once the best possible path through both frontiers cannot beat the
+        # best meeting point found so far, that meeting point is optimal.
+        if top_f == inf or top_b == inf or mu <= min(top_f, top_b):
+            break
+
+        forward = top_f <= top_b
+        if forward:
+            queue, costs, closed = queue_f, costs_f, closed_f
+            other_costs, parents = costs_b, parent_f
+            neighbors = succ
+        else:
+            queue, costs, closed = queue_b, costs_b, closed_b
+            other_costs, parents = costs_f, parent_b
+            neighbors = pred
+
+        _, __, curnode, dist = pop(queue)
+        closed.add(curnode)
+
+        for neighbor, w in neighbors[curnode].items():
+            if neighbor in closed:
+                continue
+            if forward:
+                ncost = dist + edge_cost(curnode, neighbor, w)
             else:
+                ncost = dist + edge_cost(neighbor, curnode, w)
+            if ncost >= costs.get(neighbor, inf):
+                continue
+            costs[neighbor] = ncost
+            parents[neighbor] = curnode
+            if forward:
                 h = heuristic(neighbor, target)
-            enqueued[neighbor] = ncost, h
-            push(  # type: ignore
-                queue,
-                (
-                    ncost + h,
-                    next(c),
-                    neighbor,
-                    ncost,
-                    curnode,
-                    explored_path + [neighbor],
-                ),
-            )
-
-    raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+            else:
+                h = heuristic(source, neighbor)
+            # Meet-in-the-middle priority: never expand a node whose cost
+            # already exceeds half of the current best path.
+            push(queue, (max(ncost + h, 2 * ncost), id(neighbor), neighbor, ncost))
+
+            other = other_costs.get(neighbor)
+            if other is not None and ncost + other < mu:
+                mu = ncost + other
+                meeting = neighbor
+
+    if meeting is None:
+        raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+
+    path = [meeting]
+    node = parent_f.get(meeting)
+    while node is not None:
+        path.append(node)
+        node = parent_f.get(node)
+    path.reverse()
+    node = parent_b.get(meeting)
+    while node is not None:
+        path.append(node)
+        node = parent_b.get(node)
+    return path
 
 
 def astar_path_length(
     graph: nx.Graph,
     source: Node,
     target: Node,
-    heuristic: Optional[HeuristicFunction] = None,
+    heuristic: Optional[Union[str, HeuristicFunction]] = None,
     weight: Union[str, WeightFunction] = "weight",
+    consistent_heuristic: bool = True,
+    heuristic_cache: Optional[MutableMapping[Node, float]] = None,
+    node_coords: Optional[Any] = None,
 ) -> float:
     """Returns the length of the shortest path between source and target using
     the A* ("A-star") algorithm.
@@ -239,21 +767,26 @@ def astar_path_length(
     NetworkXNoPath
         If no path exists between source and target.
 
+    Notes
+    -----
+    See :func:`astar_path` for a caveat about cached CSR conversions on
+    integer-node graphs and in-place edge-data writes.
+
     See Also
     --------
     astar_path
 
     """
-    if source not in graph or target not in graph:
-        msg = f"Either source {source} or target {target} is not in graph"
-        raise nx.NodeNotFound(msg)
-
-    weight = _weight_function(graph, weight)
-    path = astar_path(graph, source, target, heuristic, weight)
-    # The weight function looks at the current and the previous edge.
-    # Since, when we visit our first edge, we haven't visited any other edge beforehand.
-    # This is indicated by an edge with the value `None`.
-    path_edges = list(chain([None], list(zip(path[:-1], path[1:]))))
-
-    # ignoring type: we manually added a node and that node will only be passed in as u, which is valid
-    return sum(weight(graph, u, v) for u, v in zip(path_edges[:-1], path_edges[1:]))  # type: ignore
+    # The search already accumulated the path cost; re-walking the returned
+    # path would double the number of weight function calls.
+    _, cost = _astar(
+        graph,
+        source,
+        target,
+        heuristic,
+        weight,
+        consistent_heuristic,
+        heuristic_cache,
+        node_coords,
+    )
+    return cost
@@ -0,0 +1,85 @@
+from typing import Optional
+
+import networkx as nx
+import pytest
+
+from networkx_astar_path import astar_path, astar_path_bidirectional
+from networkx_astar_path.astar import Edge
+
+
+def edge_weight(graph: nx.Graph, prev_edge: Optional[Edge], cur_edge: Edge) -> float:
+    """Edge based weight function which ignores the previous edge."""
+    return graph.get_edge_data(*cur_edge)['weight']
+
+
+@pytest.fixture
+def grid() -> nx.Graph:
+    """A 5x5 grid with unit weights; nodes are ``(row, column)`` tuples."""
+    graph = nx.grid_2d_graph(5, 5)
+    nx.set_edge_attributes(graph, 1, 'weight')
+    return graph
+
+
+def test_bidirectional__undirected_grid(grid: nx.Graph) -> None:
+    """
+    The bidirectional search finds a path of the same length as the
+    forward-only search.
+    """
+    path = astar_path_bidirectional(grid, source=(0, 0), target=(4, 4))
+    assert path[0] == (0, 0)
+    assert path[-1] == (4, 4)
+    assert len(path) == len(astar_path(grid, source=(0, 0), target=(4, 4)))
+
+
+def test_bidirectional__directed() -> None:
+    graph = nx.DiGraph()
+    graph.add_weighted_edges_from(
+        [
+            ('s', 'u', 10),
+            ('s', 'x', 5),
+            ('u', 'v', 1),
+            ('u', 'x', 2),
+            ('v', 'y', 1),
+            ('x', 'u', 3),
+            ('x', 'v', 5),
+            ('x', 'y', 2),
+            ('y', 's', 7),
+            ('y', 'v', 6),
+        ]
+    )
+    assert astar_path_bidirectional(graph, source='s', target='v') == [
+        's',
+        'x',
+        'u',
+        'v',
+    ]
+
+
+def test_bidirectional__with_heuristic(grid: nx.Graph) -> None:
+    def heuristic(u, v):
+        return abs(u[0] - v[0]) + abs(u[1] - v[1])
+
+    path = astar_path_bidirectional(
+        grid, source=(0, 0), target=(4, 4), heuristic=heuristic
+    )
+    assert len(path) == 9
+
+
+def test_bidirectional__weight_function(grid: nx.Graph) -> None:
+    path = astar_path_bidirectional(
+        grid, source=(0, 0), target=(4, 4), weight=edge_weight
+    )
+    assert len(path) == 9
+
+
+def test_bidirectional__source_equals_target(grid: nx.Graph) -> None:
+    assert astar_path_bidirectional(grid, source=(1, 1), target=(1, 1)) == [(1, 1)]
+
+
+def test_bidirectional__no_path() -> None:
+    graph = nx.DiGraph()
+    graph.add_weighted_edges_from([('a', 'b', 1)])
+    graph.add_node('c')
+
+    with pytest.raises(nx.NetworkXNoPath):
+        astar_path_bidirectional(graph, source='a', target='c')
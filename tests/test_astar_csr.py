@@ -0,0 +1,67 @@
+import networkx as nx
+import pytest
+
+pytest.importorskip("numba")
+pytest.importorskip("scipy")
+
+from networkx_astar_path import astar_path, astar_path_length  # noqa: E402
+from networkx_astar_path._numba_astar import (  # noqa: E402
+    astar_path_csr,
+    csr_representation,
+)
+
+
+@pytest.fixture
+def graph() -> nx.DiGraph:
+    """
+    A small weighted graph whose nodes are the contiguous integers 0..6,
+    which makes it eligible for the jitted CSR fast path.
+    """
+    graph = nx.DiGraph()
+    graph.add_weighted_edges_from(
+        [
+            (0, 1, 2),
+            (0, 2, 1),
+            (1, 3, 2),
+            (2, 3, 1),
+            (3, 4, 1),
+            (4, 5, 1),
+            (2, 5, 10),
+        ]
+    )
+    graph.add_node(6)  # unreachable
+    return graph
+
+
+def test_astar_path__csr_fast_path(graph: nx.DiGraph) -> None:
+    """
+    Integer-node graphs with a string weight take the CSR fast path and
+    must return the same path as the generic implementation.
+    """
+    assert astar_path(graph, source=0, target=5, weight='weight') == [0, 2, 3, 4, 5]
+    assert astar_path_length(graph, source=0, target=5, weight='weight') == 4
+
+
+def test_astar_path__csr_fast_path_no_path(graph: nx.DiGraph) -> None:
+    with pytest.raises(nx.NetworkXNoPath):
+        astar_path(graph, source=0, target=6, weight='weight')
+
+
+def test_astar_path_csr__direct_call(graph: nx.DiGraph) -> None:
+    """
+    The CSR core can be called directly with a precomputed heuristic array.
+    """
+    indptr, indices, weights = csr_representation(graph, 'weight')
+    heuristic_arr = [0.0] * graph.number_of_nodes()
+
+    path = astar_path_csr(indptr, indices, weights, 0, 5, heuristic_arr)
+    assert path.tolist() == [0, 2, 3, 4, 5]
+
+
+def test_csr_representation__non_contiguous_nodes() -> None:
+    """
+    Graphs whose nodes are not 0..n-1 do not qualify for the fast path.
+    """
+    graph = nx.DiGraph()
+    graph.add_weighted_edges_from([('a', 'b', 1)])
+    assert csr_representation(graph, 'weight') is None
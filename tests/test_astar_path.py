@@ -67,6 +67,71 @@ def test_astar_path__edge_based_path(graph: nx.DiGraph) -> None:
     assert path == ['S', 'A1', 'T']
 
 
+def test_astar_path__two_argument_weight_function(graph: nx.DiGraph) -> None:
+    """
+    Weight functions that do not care about the previous edge may accept
+    just the graph and the current edge.
+    """
+
+    def simple_weight(graph: nx.Graph, cur_edge: Edge) -> float:
+        return graph.get_edge_data(*cur_edge)['weight']
+
+    path = astar_path(graph, source='S', target='T', weight=simple_weight)
+    assert path == ['S', 'A2', 'B2', 'C2', 'T']
+
+
+def test_astar_path__inconsistent_heuristic(graph: nx.DiGraph) -> None:
+    """
+    Path dependent weight functions may require re-expanding explored nodes.
+    """
+    path = astar_path(
+        graph,
+        source='S',
+        target='T',
+        weight=dependent_weight,
+        consistent_heuristic=False,
+    )
+    assert path == ['S', 'A1', 'T']
+
+
+def test_astar_path__heuristic_cache(graph: nx.DiGraph) -> None:
+    """
+    A shared cache avoids re-evaluating the heuristic across calls.
+    """
+    calls = []
+
+    def heuristic(u, v):
+        calls.append(u)
+        return 0
+
+    cache: dict = {}
+    first = astar_path(
+        graph, source='S', target='T', heuristic=heuristic, heuristic_cache=cache
+    )
+    assert calls
+
+    calls.clear()
+    second = astar_path(
+        graph, source='S', target='T', heuristic=heuristic, heuristic_cache=cache
+    )
+    assert calls == []
+    assert second == first
+
+
+def test_astar_path__integer_nodes(graph: nx.DiGraph) -> None:
+    """
+    Contiguous integer nodes take the list-backed loop and must behave
+    exactly like the generic one, including for path dependent weights.
+    """
+    int_graph = nx.convert_node_labels_to_integers(graph, label_attribute='name')
+    names = {node: int_graph.nodes[node]['name'] for node in int_graph.nodes}
+    source = next(node for node, name in names.items() if name == 'S')
+    target = next(node for node, name in names.items() if name == 'T')
+
+    path = astar_path(int_graph, source=source, target=target, weight=dependent_weight)
+    assert [names[node] for node in path] == ['S', 'A1', 'T']
+
+
 def test_astar_path_length__simple_weight_function(graph: nx.DiGraph) -> None:
     """
     Test that the implementation finds the same shortest path as the original implementation.
@@ -0,0 +1,66 @@
+import networkx as nx
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from networkx_astar_path import astar_path, astar_path_length  # noqa: E402
+
+
+@pytest.fixture
+def grid() -> nx.Graph:
+    """A 4x4 grid relabelled to integer nodes, with unit weights."""
+    graph = nx.grid_2d_graph(4, 4)
+    nx.set_edge_attributes(graph, 1, 'weight')
+    return nx.convert_node_labels_to_integers(graph)
+
+
+@pytest.fixture
+def coords(grid: nx.Graph) -> np.ndarray:
+    # Nodes are numbered row by row, so the grid position can be derived
+    # from the node label directly.
+    return np.array([(node // 4, node % 4) for node in grid.nodes])
+
+
+def test_astar_path__euclidean(grid: nx.Graph, coords: np.ndarray) -> None:
+    path = astar_path(
+        grid, source=0, target=15, heuristic='euclidean', node_coords=coords
+    )
+    assert path[0] == 0
+    assert path[-1] == 15
+    assert len(path) == 7  # 6 unit steps across the grid
+
+
+def test_astar_path__manhattan(grid: nx.Graph, coords: np.ndarray) -> None:
+    length = astar_path_length(
+        grid, source=0, target=15, heuristic='manhattan', node_coords=coords
+    )
+    assert length == 6
+
+
+def test_astar_path__haversine() -> None:
+    graph = nx.Graph()
+    # Berlin - Leipzig - Munich, weighted with rough rail distances in metres.
+    graph.add_edge(0, 1, weight=190_000)
+    graph.add_edge(1, 2, weight=430_000)
+    graph.add_edge(0, 2, weight=800_000)
+    coords = np.array(
+        [
+            (52.52, 13.40),  # Berlin
+            (51.34, 12.37),  # Leipzig
+            (48.14, 11.58),  # Munich
+        ]
+    )
+    path = astar_path(
+        graph, source=0, target=2, heuristic='haversine', node_coords=coords
+    )
+    assert path == [0, 1, 2]
+
+
+def test_astar_path__unknown_heuristic(grid: nx.Graph, coords: np.ndarray) -> None:
+    with pytest.raises(ValueError, match="Unknown heuristic"):
+        astar_path(grid, source=0, target=15, heuristic='chebyshev', node_coords=coords)
+
+
+def test_astar_path__missing_coords(grid: nx.Graph) -> None:
+    with pytest.raises(ValueError, match="node_coords"):
+        astar_path(grid, source=0, target=15, heuristic='euclidean')